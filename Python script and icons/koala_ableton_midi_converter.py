@@ -1,9 +1,16 @@
+import gc
 import os
 import sys
+import hashlib
+import shutil
+import tempfile
 import webbrowser
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
+from tkinter import font as tkfont
 from pathlib import Path
 
 import mido
@@ -72,10 +79,17 @@ def apply_style(root: tk.Tk):
 
     root.configure(bg=THEME["bg"])
 
+    # Named fonts, created once and shared by every widget
+    root.fonts = {
+        "title": tkfont.Font(root, family="Segoe UI", size=12, weight="bold"),
+        "body": tkfont.Font(root, family="Segoe UI", size=9),
+        "strong": tkfont.Font(root, family="Segoe UI", size=10, weight="bold"),
+    }
+
     style.configure("TFrame", background=THEME["bg"])
     style.configure("TLabel", background=THEME["bg"], foreground=THEME["fg"])
     style.configure("Muted.TLabel", background=THEME["bg"], foreground=THEME["muted"])
-    style.configure("Title.TLabel", background=THEME["bg"], foreground=THEME["fg"], font=("Segoe UI", 10, "bold"))
+    style.configure("Title.TLabel", background=THEME["bg"], foreground=THEME["fg"], font=root.fonts["strong"])
     style.configure("TRadiobutton", background=THEME["bg"], foreground=THEME["fg"])
     style.configure("TCheckbutton", background=THEME["bg"], foreground=THEME["fg"])
     style.configure("TButton", padding=8)
@@ -84,9 +98,46 @@ def apply_style(root: tk.Tk):
 # ----------------------------
 # Splash screen (uses icon.png)
 # ----------------------------
-def show_splash(root: tk.Tk, duration_ms: int = 900):
+def cache_dir() -> Path:
+    base = os.environ.get("LOCALAPPDATA") or str(Path.home() / ".cache")
+    return Path(base) / "koala_converter"
+
+
+def load_splash_icon(png_path: str):
+    """
+    Loads icon.png scaled down to ~128 px. The scaled copy is cached, keyed
+    on a hash of the source's contents (a onefile EXE re-extracts icon.png
+    with a fresh mtime every launch), so later starts skip the
+    decode+subsample.
+    """
+    key = hashlib.sha1(Path(png_path).read_bytes()).hexdigest()[:12]
+    cached = cache_dir() / f"icon_{key}_128.png"
+
+    if cached.exists():
+        try:
+            return tk.PhotoImage(file=str(cached))
+        except Exception:
+            pass
+
+    icon_img = tk.PhotoImage(file=png_path)
+    if icon_img.width() >= 512:
+        factor = max(1, icon_img.width() // 128)
+        icon_img = icon_img.subsample(factor, factor)
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            for stale in cached.parent.glob("icon_*_128.png"):
+                stale.unlink(missing_ok=True)
+            icon_img.write(str(cached), format="png")
+        except Exception:
+            pass
+    return icon_img
+
+
+def show_splash(root: tk.Tk, duration_ms: int = 900, on_close=None):
     """
-    Shows a minimal splash screen using icon.png, then returns.
+    Shows a minimal splash screen using icon.png and returns right away;
+    it closes itself after duration_ms (then calls on_close) once the
+    mainloop runs, so the caller can build the UI in the meantime.
     root should be created but withdrawn before calling this.
     """
     splash = tk.Toplevel(root)
@@ -106,10 +157,7 @@ def show_splash(root: tk.Tk, duration_ms: int = 900):
     icon_img = None
     try:
         if os.path.exists(png_path):
-            icon_img = tk.PhotoImage(file=png_path)
-            if icon_img.width() >= 512:
-                factor = max(1, icon_img.width() // 128)
-                icon_img = icon_img.subsample(factor, factor)
+            icon_img = load_splash_icon(png_path)
     except Exception:
         icon_img = None
 
@@ -125,45 +173,34 @@ def show_splash(root: tk.Tk, duration_ms: int = 900):
              text="Koala ↔ Ableton MIDI Converter",
              bg=THEME["bg"],
              fg=THEME["fg"],
-             font=("Segoe UI", 12, "bold")).pack()
+             font=root.fonts["title"]).pack()
 
     tk.Label(container,
              text="Loading…",
              bg=THEME["bg"],
              fg=THEME["muted"],
-             font=("Segoe UI", 9)).pack(pady=(6, 0))
+             font=root.fonts["body"]).pack(pady=(6, 0))
 
-    splash.after(duration_ms, splash.destroy)
-    splash.grab_set()
+    def _close():
+        splash.destroy()
+        if on_close is not None:
+            on_close()
+
+    splash.after(duration_ms, _close)
     splash.update()
-    root.wait_window(splash)
+    return splash
 
 
 # ----------------------------
 # Mapping core
 # ----------------------------
-def remap_within_32(w):
-    if 0 <= w <= 3:
-        return w + 12
-    if 12 <= w <= 15:
-        return w - 12
-
-    if 4 <= w <= 7:
-        return w + 4
-    if 8 <= w <= 11:
-        return w - 4
+# Offset for each position inside a 32-note block: the 4-pad rows swap
+# places (0-3 <-> 12-15, 4-7 <-> 8-11), and the same again for 16-31.
+_DELTA = ([12] * 4 + [4] * 4 + [-4] * 4 + [-12] * 4) * 2
 
-    if 16 <= w <= 19:
-        return w + 12
-    if 28 <= w <= 31:
-        return w - 12
 
-    if 20 <= w <= 23:
-        return w + 4
-    if 24 <= w <= 27:
-        return w - 4
-
-    return w
+def remap_within_32(w):
+    return w + _DELTA[w]
 
 
 def remap_note(note):
@@ -176,11 +213,8 @@ def remap_note(note):
 
 
 def clamp_midi(n):
-    if n < 0:
-        return 0, True
-    if n > 127:
-        return 127, True
-    return n, False
+    # Only called after +OCTAVE_SHIFT on a 0-127 note, so n is never negative
+    return (127, True) if n > 127 else (n, False)
 
 
 def forward_koala_to_ableton(note):
@@ -218,77 +252,439 @@ def inverse_ableton_to_koala(note):
     return n1, False
 
 
+# ----------------------------
+# Lookup tables (built once at import)
+# ----------------------------
+# The mappings are pure 0-127 -> 0-127 functions, so the per-event work in
+# convert_midi is just a table lookup. The functions above stay the source
+# of truth; the tables are derived from them. Every value fits in 0-127,
+# so they are stored as compact bytes rather than lists of ints.
+K2A_TABLE = bytes(forward_koala_to_ableton(n)[0] for n in range(128))
+K2A_CHANGED = bytes(1 if forward_koala_to_ableton(n)[1] else 0 for n in range(128))
+K2A_CLAMPED = bytes(1 if forward_koala_to_ableton(n)[2] else 0 for n in range(128))
+
+A2K_TABLE = bytes(inverse_ableton_to_koala(n)[0] for n in range(128))
+A2K_CHANGED = bytes(1 if inverse_ableton_to_koala(n)[1] else 0 for n in range(128))
+
+
+def _translation(table):
+    """
+    Pads a 128-entry table to the 256 bytes bytes.translate() expects.
+    """
+    return bytes(table) + bytes(128)
+
+
+_K2A_TRANS = _translation(K2A_TABLE)
+_K2A_CHANGED_TRANS = _translation(K2A_CHANGED)
+_K2A_CLAMPED_TRANS = _translation(K2A_CLAMPED)
+
+_A2K_TRANS = _translation(A2K_TABLE)
+_A2K_CHANGED_TRANS = _translation(A2K_CHANGED)
+_NO_CLAMP_TRANS = bytes(256)  # A2K never clamps
+
+
+def tables_for_mode(mode: str):
+    """
+    Returns the (note, changed, clamped) translation tables for a mode.
+    """
+    if mode == "K2A":
+        return _K2A_TRANS, _K2A_CHANGED_TRANS, _K2A_CLAMPED_TRANS
+    if mode == "A2K":
+        return _A2K_TRANS, _A2K_CHANGED_TRANS, _NO_CLAMP_TRANS
+    raise ValueError("Unknown mode: " + str(mode))
+
+
+def _probe_fast_note_set():
+    """
+    mido keeps message fields in the instance __dict__ and re-validates
+    them in __setattr__. Check that a direct __dict__ write is seen by the
+    message (mido 1.2+), so already-valid notes can skip the validation.
+    """
+    try:
+        msg = mido.Message("note_on", note=0)
+        vars(msg)["note"] = 1
+        return msg.note == 1 and msg.bytes()[1] == 1
+    except Exception:
+        return False
+
+
+_FAST_NOTE_SET = _probe_fast_note_set()
+
+
+def remap_track_notes(note_msgs, table, changed_tbl, clamped_tbl):
+    """
+    Remaps a track's note messages as one buffer: the notes are packed into
+    bytes and run through bytes.translate (a C loop) instead of being looked
+    up one by one. Tables are 256-byte translations (see _translation).
+    Returns (changed, clamped).
+    """
+    olds = bytes(msg.note for msg in note_msgs)
+    news = olds.translate(table)
+    flags = olds.translate(changed_tbl)
+
+    # Table values are always valid notes, so bypass mido's setter if we can
+    if _FAST_NOTE_SET:
+        for msg, new, flag in zip(note_msgs, news, flags):
+            if flag:
+                vars(msg)["note"] = new
+    else:
+        for msg, new, flag in zip(note_msgs, news, flags):
+            if flag:
+                msg.note = new
+
+    return flags.count(1), olds.translate(clamped_tbl).count(1)
+
+
+# ----------------------------
+# Raw SMF note rewrite
+# ----------------------------
+class _SmfUnsupported(Exception):
+    """
+    The file is not something the raw byte walker handles; use mido instead.
+    """
+
+
+def _read_vlq(data, i):
+    value = 0
+    while True:
+        b = data[i]
+        i += 1
+        value = (value << 7) | (b & 0x7F)
+        if b < 0x80:
+            return value, i
+
+
+def _remap_track_bytes(data, i, end, table, changed_tbl, clamped_tbl):
+    """
+    Walks one MTrk chunk body in data[i:end] and rewrites note_on/note_off
+    note bytes in place. Returns (total, changed, clamped).
+    """
+    total = 0
+    changed = 0
+    clamped = 0
+    running = None
+
+    while i < end:
+        _, i = _read_vlq(data, i)  # delta time
+
+        status = data[i]
+        if status >= 0x80:
+            i += 1
+        elif running is None:
+            raise _SmfUnsupported("data byte without running status")
+        else:
+            status = running
+
+        if status == 0xFF:
+            i += 1  # meta type
+            length, i = _read_vlq(data, i)
+            i += length
+        elif status == 0xF0 or status == 0xF7:
+            length, i = _read_vlq(data, i)
+            i += length
+            running = None
+        elif status > 0xF0:
+            raise _SmfUnsupported(f"system message 0x{status:02X} in track")
+        else:
+            running = status
+            kind = status & 0xF0
+            size = 1 if kind == 0xC0 or kind == 0xD0 else 2
+            # Out-of-range data bytes mean we lost sync (or the file is
+            # corrupt); let mido decide what to do with it.
+            if data[i] > 127 or (size == 2 and data[i + 1] > 127):
+                raise _SmfUnsupported("data byte out of range")
+
+            if kind == 0x80 or kind == 0x90:
+                note = data[i]
+                total += 1
+                if changed_tbl[note]:
+                    data[i] = table[note]
+                    changed += 1
+                    clamped += clamped_tbl[note]
+            i += size
+
+    if i != end:
+        raise _SmfUnsupported("event runs past end of track")
+    return total, changed, clamped
+
+
+def convert_midi_bytes(in_path: Path, out_path: Path, tables, copy_unchanged: bool = True):
+    """
+    Remaps notes by editing the Standard MIDI File bytes directly, without
+    building mido messages. Everything except the note bytes is written
+    back untouched. tables comes from tables_for_mode(); see convert_midi
+    for copy_unchanged. Raises _SmfUnsupported for anything unusual so the
+    caller can fall back to mido.
+    """
+    table, changed_tbl, clamped_tbl = tables
+
+    data = bytearray(Path(in_path).read_bytes())
+    if data[:4] != b"MThd":
+        raise _SmfUnsupported("no MThd header")
+    header_len = int.from_bytes(data[4:8], "big")
+    if header_len < 6 or len(data) < 8 + header_len:
+        raise _SmfUnsupported("truncated MThd header")
+    ntrks = int.from_bytes(data[10:12], "big")
+
+    total = 0
+    changed = 0
+    clamped = 0
+    tracks = 0
+
+    try:
+        i = 8 + header_len
+        while i < len(data):
+            if i + 8 > len(data):
+                raise _SmfUnsupported("truncated chunk header")
+            chunk_id = bytes(data[i:i + 4])
+            length = int.from_bytes(data[i + 4:i + 8], "big")
+            start = i + 8
+            end = start + length
+            if end > len(data):
+                raise _SmfUnsupported("truncated chunk")
+
+            if chunk_id == b"MTrk":
+                tracks += 1
+                t, c, cl = _remap_track_bytes(data, start, end, table, changed_tbl, clamped_tbl)
+                total += t
+                changed += c
+                clamped += cl
+            i = end
+    except IndexError:
+        raise _SmfUnsupported("truncated event")
+
+    # Missing or extra tracks: mido reads exactly ntrks, so let it decide
+    if tracks != ntrks:
+        raise _SmfUnsupported(f"{tracks} MTrk chunks, header says {ntrks}")
+
+    if changed:
+        Path(out_path).write_bytes(data)
+    elif copy_unchanged:
+        shutil.copyfile(in_path, out_path)
+    return total, changed, clamped
+
+
 # ----------------------------
 # MIDI conversion + batch
 # ----------------------------
-def convert_midi(in_path: Path, out_path: Path, mode: str):
+_NOTE_TYPES = frozenset(("note_on", "note_off"))
+
+
+def convert_midi(in_path: Path, out_path: Path, mode: str, copy_unchanged: bool = True):
+    """
+    Writes the converted file to out_path and returns
+    (total, changed, clamped) note-event counts. When nothing changed in a
+    well-formed file the input is copied as-is, so out_path only differs
+    from it if changed > 0; with copy_unchanged=False nothing is written at
+    all in that case. Files that need the mido fallback are always
+    re-encoded through mido.
+    """
+    tables = tables_for_mode(mode)  # rejects unknown modes up front
+
+    try:
+        return convert_midi_bytes(in_path, out_path, tables, copy_unchanged)
+    except _SmfUnsupported:
+        pass  # exotic file: let mido parse it
+
     mid = mido.MidiFile(in_path)
 
     total = 0
     changed = 0
     clamped = 0
 
+    note_types = _NOTE_TYPES  # local: no global lookup per message
+
     for track in mid.tracks:
-        for msg in track:
-            if msg.type in ("note_on", "note_off"):
-                total += 1
-                old = msg.note
-
-                if mode == "K2A":
-                    new, did_change, did_clamp = forward_koala_to_ableton(old)
-                    if did_change:
-                        msg.note = new
-                        changed += 1
-                    if did_clamp:
-                        clamped += 1
-
-                elif mode == "A2K":
-                    new, did_change = inverse_ableton_to_koala(old)
-                    if did_change:
-                        msg.note = new
-                        changed += 1
-                else:
-                    raise ValueError("Unknown mode: " + str(mode))
+        # Gather the note events of the track in one pass, then only
+        # touch the messages whose note actually has to move.
+        note_msgs = [msg for msg in track if msg.type in note_types]
+        total += len(note_msgs)
+
+        c, cl = remap_track_notes(note_msgs, *tables)
+        changed += c
+        clamped += cl
 
+    # Files that reach mido are unusual ones; always re-encode them so
+    # mido's own checks on save still reject anything it can't write.
     mid.save(out_path)
     return total, changed, clamped
 
 
 def iter_midi_files(folder: Path, recursive: bool):
-    exts = {".mid", ".midi"}
-    if recursive:
-        for p in folder.rglob("*"):
-            if p.is_file() and p.suffix.lower() in exts:
-                yield p
-    else:
-        for p in folder.iterdir():
-            if p.is_file() and p.suffix.lower() in exts:
-                yield p
+    """
+    Yields .mid/.midi files in folder. Uses os.scandir so entry types come
+    from the directory listing and rejected names never become Path objects.
+    Folders we may not read (System Volume Information, $RECYCLE.BIN...)
+    are skipped.
+    """
+    exts = (".mid", ".midi")
+    stack = [str(folder)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue
+        with it:
+            for e in it:
+                name = e.name
+                if e.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(e.path)
+                # rfind > 0: same as Path.suffix, so a bare ".mid" doesn't count
+                elif name.lower().endswith(exts) and name.rfind(".") > 0 and e.is_file():
+                    yield Path(e.path)
+
+
+def backup_name(path: Path) -> Path:
+    bak = path.with_suffix(path.suffix + ".bak")
+    i = 1
+    while bak.exists():
+        bak = path.with_suffix(path.suffix + f".bak{i}")
+        i += 1
+    return bak
 
 
 def safe_backup(path: Path):
-    bak = path.with_suffix(path.suffix + ".bak")
-    if not bak.exists():
+    """
+    Keeps the current file as .bak (or .bakN). A hardlink is used where the
+    filesystem allows it, so nothing is moved and the original stays in
+    place until it gets replaced; otherwise the file is renamed.
+    """
+    bak = backup_name(path)
+    try:
+        os.link(path, bak)
+    except OSError:
         path.replace(bak)
-        return bak
-
-    i = 1
-    while True:
-        bak_i = path.with_suffix(path.suffix + f".bak{i}")
-        if not bak_i.exists():
-            path.replace(bak_i)
-            return bak_i
-        i += 1
+    return bak
 
 
-def write_with_optional_overwrite(in_path: Path, temp_out: Path, overwrite: bool):
+def write_with_optional_overwrite(in_path: Path, temp_out: Path, overwrite: bool, changed: int):
     if not overwrite:
         return None
+    if changed == 0:
+        # Nothing was remapped: keep the original, no backup needed
+        temp_out.unlink(missing_ok=True)
+        return None
+    try:
+        shutil.copymode(in_path, temp_out)  # mkstemp files are private
+    except OSError:
+        pass
     backup_path = safe_backup(in_path)
-    temp_out.replace(in_path)
+    os.replace(temp_out, in_path)
     return backup_path
 
 
+def temp_sibling(path: Path) -> Path:
+    """
+    Creates a unique, empty .tmp file next to path. Its name never ends in
+    .mid/.midi, so it can't collide with (or be listed as) a real MIDI file.
+    """
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=path.stem + "_", suffix=".tmp")
+    os.close(fd)
+    return Path(name)
+
+
+def convert_file(in_path: Path, out_path, mode: str, overwrite: bool):
+    """
+    Converts in_path into out_path or, with overwrite, in place through a
+    temp_sibling() plus a .bak backup. Returns (total, changed, clamped,
+    backup_or_None).
+    """
+    if not overwrite:
+        t, c, cl = convert_midi(in_path, out_path, mode)
+        return t, c, cl, None
+
+    temp_out = temp_sibling(in_path)
+    try:
+        # Unchanged files are left alone, so don't write the temp copy
+        t, c, cl = convert_midi(in_path, temp_out, mode, copy_unchanged=False)
+        bak = write_with_optional_overwrite(in_path, temp_out, overwrite, c)
+    except BaseException:
+        temp_out.unlink(missing_ok=True)
+        raise
+    return t, c, cl, bak
+
+
+GC_EVERY_FILES = 64
+_files_since_gc = 0
+
+
+def _convert_one(task):
+    """
+    Batch worker (runs in a child process): converts one file and
+    returns (total, changed, clamped, backup_or_None, error_or_None).
+    Every GC_EVERY_FILES files the worker runs a full gc.collect() so
+    long batches do not keep growing its memory.
+    """
+    global _files_since_gc
+
+    in_path, out_path, mode, overwrite = task
+    try:
+        t, c, cl, bak = convert_file(Path(in_path), out_path and Path(out_path), mode, overwrite)
+        return t, c, cl, (str(bak) if bak is not None else None), None
+    except Exception as e:
+        return 0, 0, 0, None, str(e)
+    finally:
+        _files_since_gc += 1
+        if _files_since_gc >= GC_EVERY_FILES:
+            _files_since_gc = 0
+            gc.collect()
+
+
+def _convert_chunk(tasks):
+    return [_convert_one(task) for task in tasks]
+
+
+MAX_WINDOWS_WORKERS = 61  # ProcessPoolExecutor refuses more on Windows
+
+
+def run_batch(tasks):
+    """
+    Converts every task (see _convert_one) and returns one result tuple per
+    task, in order. Small batches run in-process; larger ones are split into
+    chunks across a process pool, each chunk its own future, so a crashed
+    worker only affects the files of its own chunk.
+    """
+    if len(tasks) <= 2:
+        return [_convert_one(task) for task in tasks]
+
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if sys.platform == "win32":
+        workers = min(workers, MAX_WINDOWS_WORKERS)
+    chunksize = max(1, len(tasks) // (workers * 4))
+    starts = range(0, len(tasks), chunksize)
+
+    results = [None] * len(tasks)
+    futures = {}
+    pool_error = None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            for i in starts:
+                futures[i] = ex.submit(_convert_chunk, tasks[i:i + chunksize])
+
+            for i, fut in futures.items():
+                try:
+                    results[i:i + chunksize] = fut.result()
+                except Exception as e:
+                    pool_error = e  # e.g. BrokenProcessPool
+    except Exception as e:
+        pool_error = e  # e.g. could not start workers
+
+    # Whatever has no result: never submitted means never touched; a chunk
+    # whose worker died may have been partly done (files already replaced).
+    for i in starts:
+        for k in range(i, min(i + chunksize, len(tasks))):
+            if results[k] is None:
+                reason = f"{pool_error.__class__.__name__}: {pool_error}"
+                if i in futures:
+                    err = f"status unknown, check for .bak ({reason})"
+                else:
+                    err = f"not converted ({reason})"
+                results[k] = (0, 0, 0, None, err)
+
+    return results
+
+
 # ----------------------------
 # UI
 # ----------------------------
@@ -307,6 +703,8 @@ class App:
 
         ttk.Label(outer, text="Koala ↔ Ableton MIDI Converter", style="Title.TLabel").pack(anchor="w", pady=(0, 8))
 
+        # Rows inside the two option boxes are gridded: one layout pass per
+        # box instead of a re-flow per packed sibling.
         box = ttk.LabelFrame(outer, text="Conversion direction", padding=10)
         box.pack(fill="x", pady=(0, 10))
 
@@ -314,13 +712,13 @@ class App:
             box,
             text="Koala → Ableton (rearrange pads and octaves)",
             variable=self.mode, value="K2A"
-        ).pack(anchor="w", pady=(0, 4))
+        ).grid(row=0, column=0, sticky="w", pady=(0, 4))
 
         ttk.Radiobutton(
             box,
             text="Ableton → Koala (revert a conversion)",
             variable=self.mode, value="A2K"
-        ).pack(anchor="w")
+        ).grid(row=1, column=0, sticky="w")
 
         opts = ttk.LabelFrame(outer, text="Options", padding=10)
         opts.pack(fill="x", pady=(0, 10))
@@ -330,20 +728,20 @@ class App:
             text="Batch convert a folder (instead of a single file)",
             variable=self.batch,
             command=self._toggle_batch_ui
-        ).pack(anchor="w")
+        ).grid(row=0, column=0, sticky="w")
 
         self.recursive_cb = ttk.Checkbutton(
             opts,
             text="Include subfolders (recursive)",
             variable=self.recursive
         )
-        self.recursive_cb.pack(anchor="w", pady=(2, 0))
+        self.recursive_cb.grid(row=1, column=0, sticky="w", pady=(2, 0))
 
         ttk.Checkbutton(
             opts,
             text="Overwrite in place (creates .bak backups)",
             variable=self.overwrite
-        ).pack(anchor="w", pady=(2, 0))
+        ).grid(row=2, column=0, sticky="w", pady=(2, 0))
 
         ttk.Button(outer, text="Convert", command=self.run).pack(fill="x", pady=(0, 8))
 
@@ -358,7 +756,7 @@ class App:
             highlightthickness=0,
             background=THEME["bg"],
             foreground=THEME["muted"],
-            font=("Segoe UI", 9),
+            font=master.fonts["body"],
         )
         disclaimer.pack(fill="x", pady=(6, 0))
 
@@ -434,25 +832,24 @@ class App:
 
             suffix = "_KoalaToAbleton" if mode == "K2A" else "_AbletonToKoala"
 
+            tasks = []
             for p in midi_files:
-                try:
-                    if overwrite:
-                        temp_out = p.with_name(p.stem + suffix + p.suffix)
-                    else:
-                        temp_out = out_dir / (p.stem + suffix + p.suffix)
+                # With overwrite the worker makes its own unique temp file
+                out_path = None if overwrite else str(out_dir / (p.stem + suffix + p.suffix))
+                tasks.append((str(p), out_path, mode, overwrite))
 
-                    t, c, cl = convert_midi(p, temp_out, mode)
-                    bak = write_with_optional_overwrite(p, temp_out, overwrite)
-                    if bak is not None:
-                        total_backups += 1
+            for p, (t, c, cl, bak, err) in zip(midi_files, run_batch(tasks)):
+                if err is not None:
+                    failures.append(f"{p.name}: {err}")
+                    continue
 
-                    total_files += 1
-                    total_events += t
-                    total_changed += c
-                    total_clamped += cl
+                if bak is not None:
+                    total_backups += 1
 
-                except Exception as e:
-                    failures.append(f"{p.name}: {e}")
+                total_files += 1
+                total_events += t
+                total_changed += c
+                total_clamped += cl
 
             msg = (
                 f"Converted files: {total_files}/{len(midi_files)}\n"
@@ -484,21 +881,22 @@ class App:
         suffix = "_KoalaToAbleton" if mode == "K2A" else "_AbletonToKoala"
 
         if overwrite:
-            temp_out = in_path.with_name(in_path.stem + suffix + in_path.suffix)
             out_path = in_path
         else:
             out_path = in_path.with_name(in_path.stem + suffix + in_path.suffix)
-            temp_out = out_path
 
         try:
-            total, changed, clamped = convert_midi(in_path, temp_out, mode)
-            bak = write_with_optional_overwrite(in_path, temp_out, overwrite)
+            total, changed, clamped, bak = convert_file(in_path, out_path, mode, overwrite)
         except Exception as e:
             messagebox.showerror("Error", str(e))
             return
 
-        msg = (
-            f"Saved:\n{out_path}\n\n"
+        if overwrite and changed == 0:
+            saved = f"No notes needed remapping; file left unchanged:\n{in_path}\n\n"
+        else:
+            saved = f"Saved:\n{out_path}\n\n"
+
+        msg = saved + (
             f"Note events total: {total}\n"
             f"Note events changed: {changed}\n"
         )
@@ -511,6 +909,8 @@ class App:
 
 
 def main():
+    # Batch workers re-launch the frozen EXE; let them run as workers.
+    multiprocessing.freeze_support()
     enable_dpi_awareness()
 
     root = tk.Tk()
@@ -518,10 +918,13 @@ def main():
     set_app_icon(root)
 
     root.withdraw()
-    show_splash(root, duration_ms=900)
-
-    root.deiconify()
-    App(root)
+    if "--no-splash" in sys.argv[1:]:
+        App(root)
+        root.deiconify()  # first paint with every widget already laid out
+    else:
+        # Build the UI while the splash is up; show it when the splash closes.
+        show_splash(root, duration_ms=900, on_close=root.deiconify)
+        App(root)
     root.mainloop()
 
 